@@ -8,6 +8,7 @@ from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 
 from .config import Config
+from .utils.profiling import MongoPhaseListener, init_profiling
 
 # Initialize extensions
 mongo = PyMongo()
@@ -20,9 +21,12 @@ def create_app(config_class=Config):
     app.config.from_object(config_class)
     
     # Initialize extensions with app
-    mongo.init_app(app)
+    mongo.init_app(app, event_listeners=[MongoPhaseListener()])
     jwt.init_app(app)
     
+    # Per-request phase timings and slow-request capture
+    init_profiling(app)
+    
     # Enable CORS for all routes
     CORS(app, resources={
         r"/*": {
@@ -35,12 +39,53 @@ def create_app(config_class=Config):
     # Register blueprints
     from .routes.auth import auth_bp
     from .routes.video import video_bp
+    from .routes.admin import admin_bp
     app.register_blueprint(auth_bp, url_prefix='/auth')
     app.register_blueprint(video_bp, url_prefix='')
+    app.register_blueprint(admin_bp, url_prefix='/admin')
+    
+    # Cached, coalesced catalog reads
+    from .models.video import catalog_cache, catalog_flight
+    from .utils.catalog_cache import CatalogWatcher
+    catalog_flight.timeout = app.config['CATALOG_COALESCE_TIMEOUT']
+    if app.config['CATALOG_WATCH_ENABLED']:
+        catalog_cache.ttl = app.config['CATALOG_CACHE_TTL']
+    else:
+        # No cross-worker invalidation, so bound staleness with a short TTL
+        catalog_cache.ttl = min(
+            app.config['CATALOG_CACHE_TTL'], app.config['CATALOG_CACHE_UNWATCHED_TTL']
+        )
+    catalog_cache.miss_ttl = app.config['CATALOG_CACHE_MISS_TTL']
+    catalog_cache.max_entries = app.config['CATALOG_CACHE_MAX_ENTRIES']
+    
+    # Follow the catalog version so cached video reads stay consistent across workers
+    catalog_watcher = CatalogWatcher(
+        mongo.db, catalog_cache,
+        poll_interval=app.config['CATALOG_POLL_INTERVAL']
+    )
+    app.extensions['catalog_watcher'] = catalog_watcher
+    
+    if app.config['CATALOG_WATCH_ENABLED']:
+        # Started lazily so each (possibly forked) worker process runs its own watcher
+        @app.before_request
+        def start_catalog_watcher():
+            catalog_watcher.start()
     
     # Health check route
     @app.route('/health')
     def health_check():
         return {'status': 'healthy', 'message': 'API is running'}
     
+    # Metrics route
+    @app.route('/metrics')
+    def metrics():
+        return {
+            'catalog_reads': catalog_flight.stats(),
+            'catalog_cache': {
+                **catalog_cache.stats(),
+                'version': catalog_watcher.version,
+                'watch_mode': catalog_watcher.mode
+            }
+        }
+    
     return app
@@ -16,10 +16,41 @@ class Config:
     
     # JWT Configuration
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'dev-secret-key')
-    JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=24)
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(
+        minutes=int(os.getenv('JWT_ACCESS_TOKEN_MINUTES', '15'))
+    )
+    JWT_REFRESH_TOKEN_EXPIRES = timedelta(
+        days=int(os.getenv('JWT_REFRESH_TOKEN_DAYS', '30'))
+    )
     JWT_TOKEN_LOCATION = ['headers']
     JWT_HEADER_NAME = 'Authorization'
     JWT_HEADER_TYPE = 'Bearer'
+    
+    # Catalog read coalescing (seconds a waiter blocks on an in-flight query)
+    CATALOG_COALESCE_TIMEOUT = float(os.getenv('CATALOG_COALESCE_TIMEOUT', '5'))
+    
+    # Catalog cache (TTLs in seconds; misses are cached only briefly)
+    CATALOG_CACHE_TTL = float(os.getenv('CATALOG_CACHE_TTL', '300'))
+    CATALOG_CACHE_MISS_TTL = float(os.getenv('CATALOG_CACHE_MISS_TTL', '5'))
+    CATALOG_CACHE_MAX_ENTRIES = int(os.getenv('CATALOG_CACHE_MAX_ENTRIES', '10000'))
+    # Used instead of CATALOG_CACHE_TTL when the watcher is disabled, since other
+    # workers' writes are then only picked up when entries expire
+    CATALOG_CACHE_UNWATCHED_TTL = float(os.getenv('CATALOG_CACHE_UNWATCHED_TTL', '5'))
+    
+    # Catalog cache invalidation (seconds between version checks)
+    CATALOG_WATCH_ENABLED = os.getenv('CATALOG_WATCH_ENABLED', '1') == '1'
+    CATALOG_POLL_INTERVAL = float(os.getenv('CATALOG_POLL_INTERVAL', '1'))
+    
+    # Admin access (comma-separated user emails)
+    ADMIN_EMAILS = [
+        email.strip() for email in os.getenv('ADMIN_EMAILS', '').split(',')
+        if email.strip()
+    ]
+    
+    # Profiling
+    SLOW_REQUEST_THRESHOLD_MS = float(os.getenv('SLOW_REQUEST_THRESHOLD_MS', '500'))
+    SLOW_REQUEST_LOG_SIZE = int(os.getenv('SLOW_REQUEST_LOG_SIZE', '100'))
+    PROFILER_MAX_SECONDS = float(os.getenv('PROFILER_MAX_SECONDS', '30'))
 
 
 class DevelopmentConfig(Config):
@@ -0,0 +1,44 @@
+"""
+Catalog Version Model
+Tracks a monotonically increasing version bumped on every catalog write
+"""
+from pymongo import ReturnDocument
+
+
+class CatalogVersion:
+    """Catalog version document for cross-worker cache invalidation"""
+
+    COLLECTION_NAME = 'catalog_version'
+
+    DOCUMENT_ID = 'videos'
+
+    # Number of recent changes kept so workers can invalidate selectively
+    MAX_CHANGES = 100
+
+    @classmethod
+    def bump(cls, mongo_db, video_id):
+        """
+        Increment the catalog version and record which video changed
+        Returns the new version number
+        """
+        doc = mongo_db[cls.COLLECTION_NAME].find_one_and_update(
+            {'_id': cls.DOCUMENT_ID},
+            [
+                {'$set': {'version': {'$add': [{'$ifNull': ['$version', 0]}, 1]}}},
+                {'$set': {'changes': {'$slice': [
+                    {'$concatArrays': [
+                        {'$ifNull': ['$changes', []]},
+                        [{'version': '$version', 'video_id': str(video_id)}]
+                    ]},
+                    -cls.MAX_CHANGES
+                ]}}}
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return doc['version']
+
+    @classmethod
+    def get(cls, mongo_db):
+        """Get the current version document (None if the catalog was never written)"""
+        return mongo_db[cls.COLLECTION_NAME].find_one({'_id': cls.DOCUMENT_ID})
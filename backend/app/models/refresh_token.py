@@ -0,0 +1,91 @@
+"""
+Refresh Token Family Model
+Tracks rotating refresh tokens so a replayed (already rotated) token is detected
+"""
+import secrets
+from datetime import datetime
+from pymongo import ReturnDocument
+
+
+class RefreshTokenFamily:
+    """
+    Refresh token family for MongoDB operations
+    A family is created at login; each refresh rotates its nonce, and presenting
+    a stale nonce revokes the whole family
+    """
+
+    COLLECTION_NAME = 'refresh_tokens'
+
+    _indexes_ready = False
+
+    @staticmethod
+    def new_nonce():
+        """Generate a random nonce identifying the current refresh token"""
+        return secrets.token_urlsafe(16)
+
+    @classmethod
+    def ensure_indexes(cls, mongo_db):
+        """Create the TTL index that expires families after their last refresh token"""
+        if cls._indexes_ready:
+            return
+        mongo_db[cls.COLLECTION_NAME].create_index('expires_at', expireAfterSeconds=0)
+        cls._indexes_ready = True
+
+    @classmethod
+    def create(cls, mongo_db, user_id, expires_in):
+        """
+        Start a new token family for a user
+        Returns (family_id, nonce) to embed in the first refresh token
+        """
+        cls.ensure_indexes(mongo_db)
+        family_id = secrets.token_urlsafe(16)
+        nonce = cls.new_nonce()
+        now = datetime.utcnow()
+        mongo_db[cls.COLLECTION_NAME].insert_one({
+            '_id': family_id,
+            'user_id': str(user_id),
+            'nonce': nonce,
+            'revoked': False,
+            'created_at': now,
+            'expires_at': now + expires_in
+        })
+        return family_id, nonce
+
+    @classmethod
+    def rotate(cls, mongo_db, family_id, user_id, nonce, expires_in):
+        """
+        Swap the family's current nonce for a new one in a single indexed update
+        Returns the new nonce, or None if the token is unknown, revoked or reused
+        (a reused token revokes the family)
+        """
+        new_nonce = cls.new_nonce()
+        collection = mongo_db[cls.COLLECTION_NAME]
+        doc = collection.find_one_and_update(
+            {
+                '_id': family_id,
+                'user_id': str(user_id),
+                'nonce': nonce,
+                'revoked': False
+            },
+            {'$set': {
+                'nonce': new_nonce,
+                'expires_at': datetime.utcnow() + expires_in
+            }},
+            projection={'_id': 1},
+            return_document=ReturnDocument.AFTER
+        )
+        if doc:
+            return new_nonce
+
+        # Either the family is gone/revoked or an old token was replayed
+        cls.revoke(mongo_db, family_id)
+        return None
+
+    @classmethod
+    def revoke(cls, mongo_db, family_id):
+        """Revoke every refresh token in a family"""
+        result = mongo_db[cls.COLLECTION_NAME].update_one(
+            {'_id': family_id, 'revoked': False},
+            {'$set': {'revoked': True}}
+        )
+        return bool(result.modified_count)
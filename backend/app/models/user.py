@@ -6,6 +6,8 @@ from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
 from bson import ObjectId
 
+from app.utils.profiling import phase
+
 
 class User:
     """User model for MongoDB operations"""
@@ -22,12 +24,14 @@ class User:
     @staticmethod
     def hash_password(password):
         """Generate a secure password hash"""
-        return generate_password_hash(password, method='pbkdf2:sha256')
+        with phase('password_hash'):
+            return generate_password_hash(password, method='pbkdf2:sha256')
     
     @staticmethod
     def verify_password(password_hash, password):
         """Verify a password against its hash"""
-        return check_password_hash(password_hash, password)
+        with phase('password_hash'):
+            return check_password_hash(password_hash, password)
     
     def to_dict(self):
         """Convert user to dictionary for MongoDB insertion"""
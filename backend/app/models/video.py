@@ -7,6 +7,20 @@ import secrets
 import hashlib
 from datetime import datetime, timedelta
 from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.models.catalog import CatalogVersion
+from app.utils.catalog_cache import CatalogCache
+from app.utils.coalesce import SingleFlight
+from app.utils.profiling import phase
+
+# Shared across request threads so concurrent cache misses hit MongoDB once
+# (timeout is set from CATALOG_COALESCE_TIMEOUT in create_app)
+catalog_flight = SingleFlight()
+
+# Long-lived read cache, invalidated through the catalog version document
+# (limits are set from the CATALOG_CACHE_* settings in create_app)
+catalog_cache = CatalogCache()
 
 
 class Video:
@@ -53,7 +67,8 @@ class Video:
         
         # Generate playback token if requested
         if include_token and self._id and user_id:
-            data['playback_token'] = self.generate_playback_token(user_id)
+            with phase('token_mint'):
+                data['playback_token'] = self.generate_playback_token(user_id)
         
         return data
     
@@ -147,22 +162,85 @@ class Video:
         )
         result = mongo_db.videos.insert_one(video.to_dict())
         video._id = result.inserted_id
+        cls._catalog_changed(mongo_db, video._id)
         return video
     
     @classmethod
-    def find_by_id(cls, mongo_db, video_id):
-        """Find a video by its ID"""
+    def deactivate(cls, mongo_db, video_id):
+        """Hide a video from the dashboard and block streaming"""
         try:
-            data = mongo_db.videos.find_one({'_id': ObjectId(video_id)})
-            return cls.from_dict(data)
+            object_id = ObjectId(video_id)
         except Exception:
+            return False
+        result = mongo_db.videos.update_one(
+            {'_id': object_id, 'is_active': True},
+            {'$set': {'is_active': False}}
+        )
+        if result.modified_count:
+            cls._catalog_changed(mongo_db, object_id)
+        return bool(result.modified_count)
+    
+    @staticmethod
+    def _catalog_changed(mongo_db, video_id):
+        """Publish a catalog write to other workers and drop local entries"""
+        CatalogVersion.bump(mongo_db, video_id)
+        catalog_cache.invalidate_video(video_id)
+    
+    @classmethod
+    def find_by_id(cls, mongo_db, video_id):
+        """
+        Find a video by its ID (cached; concurrent misses share one query)
+        Returns None for malformed IDs; database errors and coalescing
+        timeouts propagate to every waiting caller
+        """
+        try:
+            object_id = ObjectId(video_id)
+        except (InvalidId, TypeError):
             return None
+        key = ('find_by_id', mongo_db.name, object_id)
+        data = catalog_cache.get_or_load(
+            key,
+            lambda: mongo_db.videos.find_one({'_id': object_id}),
+            flight=catalog_flight
+        )
+        return cls.from_dict(data)
+    
+    @classmethod
+    def find_by_ids(cls, mongo_db, video_ids):
+        """
+        Find several videos by ID with a single $in query for cache misses
+        Returns a dict of video_id -> Video (invalid or unknown IDs are omitted)
+        """
+        keys = {}
+        for video_id in video_ids:
+            try:
+                keys[video_id] = ('find_by_id', mongo_db.name, ObjectId(video_id))
+            except (InvalidId, TypeError):
+                continue
+        
+        def load(missing):
+            cursor = mongo_db.videos.find({'_id': {'$in': [key[-1] for key in missing]}})
+            docs = {doc['_id']: doc for doc in cursor}
+            return {key: docs.get(key[-1]) for key in missing}
+        
+        data = catalog_cache.get_many_or_load(set(keys.values()), load)
+        videos = {}
+        for video_id, key in keys.items():
+            video = cls.from_dict(data.get(key))
+            if video:
+                videos[video_id] = video
+        return videos
     
     @classmethod
     def find_active(cls, mongo_db, limit=2):
-        """Find active videos (used for dashboard)"""
-        cursor = mongo_db.videos.find({'is_active': True}).limit(limit)
-        return [cls.from_dict(doc) for doc in cursor]
+        """Find active videos (used for dashboard; cached, concurrent misses share one query)"""
+        key = ('find_active', mongo_db.name, limit)
+        docs = catalog_cache.get_or_load(
+            key,
+            lambda: list(mongo_db.videos.find({'is_active': True}).limit(limit)),
+            flight=catalog_flight
+        )
+        return [cls.from_dict(doc) for doc in docs]
     
     @classmethod
     def seed_sample_videos(cls, mongo_db):
@@ -0,0 +1,98 @@
+"""
+Admin Routes
+Handles on-demand profiling and slow-request inspection
+"""
+import math
+
+from flask import Blueprint, request, jsonify, Response, current_app
+from app.utils.decorators import admin_required
+
+admin_bp = Blueprint('admin', __name__)
+
+
+@admin_bp.route('/profile', methods=['POST'])
+@admin_required
+def profile():
+    """
+    Run the statistical stack sampler and return collapsed stacks
+    Blocks for the requested duration; only one run is allowed at a time
+
+    Request Body (optional):
+        - seconds: Sampling duration (default 5, capped at PROFILER_MAX_SECONDS)
+        - interval_ms: Sampling interval in milliseconds (default 10, clamped to 1-1000)
+        - include_idle: Also sample idle and background threads (default false)
+
+    Headers:
+        - Authorization: Bearer <access_token> (admin user)
+
+    Returns:
+        - text/plain collapsed stacks ("frame;frame;frame count" per line),
+          suitable for flamegraph.pl or speedscope
+    """
+    data = request.get_json(silent=True) or {}
+
+    try:
+        seconds = float(data.get('seconds', 5))
+        interval_ms = float(data.get('interval_ms', 10))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'seconds and interval_ms must be numbers'}), 400
+
+    if not math.isfinite(seconds) or not math.isfinite(interval_ms):
+        return jsonify({'error': 'seconds and interval_ms must be finite'}), 400
+    if seconds <= 0 or interval_ms <= 0:
+        return jsonify({'error': 'seconds and interval_ms must be positive'}), 400
+    include_idle = data.get('include_idle', False)
+    if not isinstance(include_idle, bool):
+        return jsonify({'error': 'include_idle must be a boolean'}), 400
+    seconds = min(seconds, current_app.config['PROFILER_MAX_SECONDS'])
+    interval_ms = min(max(interval_ms, 1), 1000)
+
+    stacks = current_app.extensions['stack_sampler'].sample(
+        seconds,
+        interval=interval_ms / 1000,
+        include_idle=include_idle
+    )
+    if stacks is None:
+        return jsonify({'error': 'A profiling run is already in progress'}), 409
+
+    return Response(stacks, status=200, mimetype='text/plain')
+
+
+@admin_bp.route('/slow-requests', methods=['GET'])
+@admin_required
+def get_slow_requests():
+    """
+    List captured slow requests with their per-phase timings
+
+    Headers:
+        - Authorization: Bearer <access_token> (admin user)
+
+    Returns:
+        - threshold_ms: Current capture threshold
+        - requests: Captured requests, most recent first
+    """
+    slow_requests = current_app.extensions['slow_requests']
+    entries = slow_requests.entries()
+
+    return jsonify({
+        'threshold_ms': slow_requests.threshold_ms,
+        'requests': entries,
+        'count': len(entries)
+    }), 200
+
+
+@admin_bp.route('/slow-requests', methods=['DELETE'])
+@admin_required
+def clear_slow_requests():
+    """
+    Clear the slow-request buffer
+
+    Headers:
+        - Authorization: Bearer <access_token> (admin user)
+
+    Returns:
+        - message: Success message
+    """
+    current_app.extensions['slow_requests'].clear()
+
+    return jsonify({'message': 'Slow request log cleared'}), 200
@@ -1,23 +1,48 @@
 """
 Authentication Routes
-Handles user signup, login, logout, and profile retrieval
+Handles user signup, login, token refresh, logout, and profile retrieval
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import (
     create_access_token,
-    jwt_required,
+    create_refresh_token,
     get_jwt_identity,
     get_jwt
 )
-from app import mongo
+from app import mongo, jwt
+from app.models.refresh_token import RefreshTokenFamily
 from app.models.user import User
+from app.utils.decorators import timed_jwt_required
+from app.utils.profiling import phase
 
 auth_bp = Blueprint('auth', __name__)
 
 # Simple token blocklist (in production, use Redis)
+# Per worker process: other workers accept a logged-out access token until it
+# expires, but its refresh token family is revoked everywhere
 token_blocklist = set()
 
 
+@jwt.token_in_blocklist_loader
+def check_token_blocklist(jwt_header, jwt_payload):
+    """Reject tokens that were invalidated by logout"""
+    return jwt_payload['jti'] in token_blocklist
+
+
+def _issue_tokens(user_id, family_id, nonce):
+    """Create an access token and a refresh token bound to a token family"""
+    with phase('token_mint'):
+        access_token = create_access_token(
+            identity=user_id,
+            additional_claims={'family': family_id}
+        )
+        refresh_token = create_refresh_token(
+            identity=user_id,
+            additional_claims={'family': family_id, 'nonce': nonce}
+        )
+    return access_token, refresh_token
+
+
 @auth_bp.route('/signup', methods=['POST'])
 def signup():
     """
@@ -64,14 +89,15 @@ def signup():
 @auth_bp.route('/login', methods=['POST'])
 def login():
     """
-    Authenticate user and return JWT token
+    Authenticate user and return JWT tokens
     
     Request Body:
         - email: User's email address
         - password: User's password
     
     Returns:
-        - access_token: JWT access token
+        - access_token: Short-lived JWT access token
+        - refresh_token: Rotating refresh token for /auth/refresh
         - user: User profile data
     """
     data = request.get_json()
@@ -95,17 +121,58 @@ def login():
     if not User.verify_password(user.password_hash, password):
         return jsonify({'error': 'Invalid email or password'}), 401
     
-    # Create access token
-    access_token = create_access_token(identity=str(user._id))
+    # Start a refresh token family and create tokens
+    user_id = str(user._id)
+    family_id, nonce = RefreshTokenFamily.create(
+        mongo.db, user_id, current_app.config['JWT_REFRESH_TOKEN_EXPIRES']
+    )
+    access_token, refresh_token = _issue_tokens(user_id, family_id, nonce)
     
     return jsonify({
         'access_token': access_token,
+        'refresh_token': refresh_token,
         'user': user.to_json()
     }), 200
 
 
+@auth_bp.route('/refresh', methods=['POST'])
+@timed_jwt_required(refresh=True)
+def refresh():
+    """
+    Exchange a refresh token for a new access token and refresh token
+    The presented refresh token is rotated; reusing it revokes its whole family
+    
+    Headers:
+        - Authorization: Bearer <refresh_token>
+    
+    Returns:
+        - access_token: New JWT access token
+        - refresh_token: New refresh token (replaces the one presented)
+    """
+    claims = get_jwt()
+    current_user_id = get_jwt_identity()
+    family_id = claims.get('family')
+    
+    if not family_id or not claims.get('nonce'):
+        return jsonify({'error': 'Invalid refresh token'}), 401
+    
+    nonce = RefreshTokenFamily.rotate(
+        mongo.db, family_id, current_user_id, claims['nonce'],
+        current_app.config['JWT_REFRESH_TOKEN_EXPIRES']
+    )
+    if not nonce:
+        return jsonify({'error': 'Refresh token has been revoked or reused'}), 401
+    
+    access_token, refresh_token = _issue_tokens(current_user_id, family_id, nonce)
+    
+    return jsonify({
+        'access_token': access_token,
+        'refresh_token': refresh_token
+    }), 200
+
+
 @auth_bp.route('/me', methods=['GET'])
-@jwt_required()
+@timed_jwt_required()
 def get_current_user():
     """
     Get current authenticated user's profile
@@ -126,10 +193,10 @@ def get_current_user():
 
 
 @auth_bp.route('/logout', methods=['POST'])
-@jwt_required()
+@timed_jwt_required()
 def logout():
     """
-    Logout user by invalidating the current token
+    Logout user by invalidating the current token and its refresh tokens
     
     Headers:
         - Authorization: Bearer <access_token>
@@ -137,8 +204,11 @@ def logout():
     Returns:
         - message: Success message
     """
-    jti = get_jwt()['jti']
-    token_blocklist.add(jti)
+    claims = get_jwt()
+    token_blocklist.add(claims['jti'])
+    
+    if claims.get('family'):
+        RefreshTokenFamily.revoke(mongo.db, claims['family'])
     
     return jsonify({'message': 'Successfully logged out'}), 200
 
@@ -3,15 +3,71 @@ Video Routes
 Handles video listing (dashboard) and secure streaming
 """
 from flask import Blueprint, request, jsonify, Response
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import get_jwt_identity
 from app import mongo
 from app.models.video import Video
+from app.utils.coalesce import CoalesceTimeout
+from app.utils.decorators import timed_jwt_required
 
 video_bp = Blueprint('video', __name__)
 
+# Upper bound on items resolved by a single batch stream request
+MAX_BATCH_ITEMS = 50
+
+
+def _stream_payload(video_id, video):
+    """
+    Build the masked stream response for a validated video
+    The YouTube ID is only revealed here, in the backend response
+    """
+    embed_url = f"https://www.youtube.com/embed/{video.youtube_id}?autoplay=1&rel=0&modestbranding=1"
+    
+    # Also provide ready-to-use HTML for WebView
+    embed_html = f'''
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <style>
+            * {{ margin: 0; padding: 0; }}
+            html, body {{ width: 100%; height: 100%; background: #000; }}
+            iframe {{ width: 100%; height: 100%; border: none; }}
+        </style>
+    </head>
+    <body>
+        <iframe 
+            src="{embed_url}"
+            allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture"
+            allowfullscreen>
+        </iframe>
+    </body>
+    </html>
+    '''
+    
+    return {
+        'video_id': video_id,
+        'title': video.title,
+        'embed_url': embed_url,
+        'embed_html': embed_html
+    }
+
+
+@video_bp.errorhandler(CoalesceTimeout)
+def handle_coalesce_timeout(error):
+    """
+    Report a catalog read that timed out waiting on a shared query
+    (the HTML embed route handles this itself)
+    """
+    return jsonify({'error': 'Video catalog is temporarily unavailable'}), 503
+
+
+def _batch_error(video_id, message, status):
+    """Build a per-item error entry for a batch stream response"""
+    return {'video_id': video_id or None, 'error': message, 'status': status}
+
 
 @video_bp.route('/dashboard', methods=['GET'])
-@jwt_required()
+@timed_jwt_required()
 def get_dashboard():
     """
     Get dashboard with video tiles
@@ -45,7 +101,7 @@ def get_dashboard():
 
 
 @video_bp.route('/video/<video_id>/stream', methods=['GET'])
-@jwt_required()
+@timed_jwt_required()
 def stream_video(video_id):
     """
     Get masked stream URL for video playback
@@ -84,37 +140,65 @@ def stream_video(video_id):
     if not Video.validate_playback_token(playback_token, video_id, current_user_id):
         return jsonify({'error': 'Invalid or expired playback token'}), 401
     
-    # Generate masked embed URL
-    # The YouTube ID is only revealed here, in the backend response
-    embed_url = f"https://www.youtube.com/embed/{video.youtube_id}?autoplay=1&rel=0&modestbranding=1"
+    return jsonify(_stream_payload(video_id, video)), 200
+
+
+@video_bp.route('/video/stream/batch', methods=['POST'])
+@timed_jwt_required()
+def stream_videos_batch():
+    """
+    Resolve masked stream URLs for several videos in one request
+    Fetches all videos with a single query and validates each playback token
     
-    # Also provide ready-to-use HTML for WebView
-    embed_html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <style>
-            * {{ margin: 0; padding: 0; }}
-            html, body {{ width: 100%; height: 100%; background: #000; }}
-            iframe {{ width: 100%; height: 100%; border: none; }}
-        </style>
-    </head>
-    <body>
-        <iframe 
-            src="{embed_url}"
-            allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture"
-            allowfullscreen>
-        </iframe>
-    </body>
-    </html>
-    '''
+    Request Body:
+        - items: Array of {video_id, token} pairs (at most MAX_BATCH_ITEMS)
+    
+    Headers:
+        - Authorization: Bearer <access_token>
+    
+    Returns:
+        - results: Array in request order; each entry is either the same payload
+          as /video/<video_id>/stream or {video_id, error, status}
+    """
+    current_user_id = get_jwt_identity()
+    data = request.get_json(silent=True)
+    
+    items = data.get('items') if isinstance(data, dict) else None
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'items must be a non-empty list'}), 400
+    if len(items) > MAX_BATCH_ITEMS:
+        return jsonify({'error': f'At most {MAX_BATCH_ITEMS} items per request'}), 400
+    
+    video_ids = [
+        str(item.get('video_id')) for item in items
+        if isinstance(item, dict) and item.get('video_id')
+    ]
+    videos = Video.find_by_ids(mongo.db, video_ids)
+    
+    results = []
+    for item in items:
+        if not isinstance(item, dict):
+            item = {}
+        video_id = str(item.get('video_id') or '')
+        playback_token = item.get('token')
+        
+        # Same checks, in the same order, as the single-video endpoint
+        if not video_id or not playback_token:
+            results.append(_batch_error(video_id, 'Video ID and playback token are required', 400))
+            continue
+        video = videos.get(video_id)
+        if not video:
+            results.append(_batch_error(video_id, 'Video not found', 404))
+        elif not video.is_active:
+            results.append(_batch_error(video_id, 'Video is not available', 403))
+        elif not Video.validate_playback_token(playback_token, video_id, current_user_id):
+            results.append(_batch_error(video_id, 'Invalid or expired playback token', 401))
+        else:
+            results.append(_stream_payload(video_id, video))
     
     return jsonify({
-        'video_id': video_id,
-        'title': video.title,
-        'embed_url': embed_url,
-        'embed_html': embed_html
+        'results': results,
+        'count': len(results)
     }), 200
 
 
@@ -138,7 +222,14 @@ def serve_embed_page(video_id):
         )
     
     # Find the video
-    video = Video.find_by_id(mongo.db, video_id)
+    try:
+        video = Video.find_by_id(mongo.db, video_id)
+    except CoalesceTimeout:
+        return Response(
+            '<html><body><h1>Temporarily Unavailable</h1><p>Please try again</p></body></html>',
+            status=503,
+            mimetype='text/html'
+        )
     if not video or not video.is_active:
         return Response(
             '<html><body><h1>Video Not Found</h1></body></html>',
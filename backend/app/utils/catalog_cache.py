@@ -0,0 +1,263 @@
+"""
+Catalog Cache
+In-process TTL cache for video reads, kept consistent across workers by
+watching the catalog version document
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from pymongo.errors import PyMongoError
+
+from app.models.catalog import CatalogVersion
+
+MISSING = object()
+
+
+class CatalogCache:
+    """
+    Thread-safe TTL cache keyed by (query name, database name, ..., argument)
+    Loads that race with an invalidation are not stored, so a stale read can
+    never overwrite a newer invalidation
+    Bounded to max_entries (least recently used entries are evicted first);
+    not-found results are kept only for the shorter miss_ttl
+    """
+
+    # Seconds between sweeps for expired entries
+    SWEEP_INTERVAL = 1.0
+
+    def __init__(self, ttl=300.0, miss_ttl=5.0, max_entries=10000):
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._next_sweep = 0.0
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key):
+        """Return the cached value for key, or MISSING if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._entries.pop(key, None)
+            self._misses += 1
+            return MISSING
+
+    def get_or_load(self, key, loader, flight=None):
+        """
+        Return the cached value for key, calling loader() on a miss
+        When a SingleFlight is given, concurrent misses share one load
+        """
+        value = self.get(key)
+        if value is not MISSING:
+            return value
+        if flight is not None:
+            return flight.do(key, lambda: self._load(key, loader))
+        return self._load(key, loader)
+
+    def get_many_or_load(self, keys, loader):
+        """
+        Return {key: value} for keys, calling loader(missing_keys) once for all
+        misses; loader must return {key: value} for every key it was given
+        """
+        values = {}
+        missing = []
+        for key in keys:
+            value = self.get(key)
+            if value is MISSING:
+                missing.append(key)
+            else:
+                values[key] = value
+        if not missing:
+            return values
+
+        with self._lock:
+            generation = self._generation
+        loaded = loader(missing)
+        with self._lock:
+            if generation == self._generation:
+                for key in missing:
+                    self._store(key, loaded[key])
+        values.update(loaded)
+        return values
+
+    def _load(self, key, loader):
+        with self._lock:
+            generation = self._generation
+        value = loader()
+        with self._lock:
+            if generation == self._generation:
+                self._store(key, value)
+        return value
+
+    def _store(self, key, value):
+        """Insert an entry, then sweep and evict to stay bounded (caller holds the lock)"""
+        now = time.monotonic()
+        ttl = self.miss_ttl if value is None else self.ttl
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (now + ttl, value)
+        self._entries.move_to_end(key)
+        if now >= self._next_sweep or len(self._entries) > self.max_entries:
+            self._sweep(now)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _sweep(self, now):
+        """Drop expired entries (caller holds the lock)"""
+        for key in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+        self._next_sweep = now + self.SWEEP_INTERVAL
+
+    def invalidate_video(self, video_id):
+        """Drop the entry for one video plus every list query that may include it"""
+        video_id = str(video_id)
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+            for key in list(self._entries):
+                if key[0] != 'find_by_id' or str(key[-1]) == video_id:
+                    del self._entries[key]
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+            self._entries.clear()
+
+    def stats(self):
+        """Return hit, miss, eviction and invalidation counters"""
+        with self._lock:
+            self._sweep(time.monotonic())
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'entries': len(self._entries)
+            }
+
+
+class CatalogWatcher:
+    """
+    Background thread that follows the catalog version document
+    Uses a change stream when the server supports it (replica sets) and falls
+    back to polling otherwise, e.g. on a local single-node mongod
+    """
+
+    def __init__(self, mongo_db, cache, poll_interval=1.0):
+        self.mongo_db = mongo_db
+        self.cache = cache
+        self.poll_interval = poll_interval
+        self.version = None
+        self.mode = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def start(self):
+        """
+        Start watching in a daemon thread, once per process
+        Safe to call on every request: a forked worker gets its own thread
+        instead of relying on one inherited from the parent
+        """
+        if self._pid == os.getpid():
+            return self
+        with self._lock:
+            if self._pid != os.getpid():
+                self._thread = threading.Thread(
+                    target=self._run, name='catalog-watcher', daemon=True
+                )
+                self._thread.start()
+                self._pid = os.getpid()
+        return self
+
+    def stop(self):
+        """Signal the watcher thread to exit"""
+        self._stop.set()
+
+    def apply(self, doc):
+        """
+        Invalidate cache entries for changes newer than the last seen version
+        Clears the whole cache if any intermediate change is no longer recorded,
+        or if the version went backwards (the version document was reset)
+        """
+        if not doc:
+            return
+        version = doc.get('version', 0)
+        if self.version is not None and version == self.version:
+            return
+        if self.version is not None and version < self.version:
+            self.cache.clear()
+            self.version = version
+            return
+
+        changes = [c for c in doc.get('changes', [])
+                   if self.version is None or c['version'] > self.version]
+        seen = {c['version'] for c in changes}
+        if self.version is None or len(seen) < version - self.version:
+            self.cache.clear()
+        else:
+            for change in changes:
+                self.cache.invalidate_video(change['video_id'])
+        self.version = version
+
+    def poll(self):
+        """Read the version document once and apply it"""
+        doc = CatalogVersion.get(self.mongo_db)
+        if doc is None:
+            # A missing document after a version was seen means it was reset
+            if self.version:
+                self.cache.clear()
+            self.version = 0
+            return
+        self.apply(doc)
+
+    def _watch(self):
+        """Follow the version document via a change stream until stopped"""
+        collection = self.mongo_db[CatalogVersion.COLLECTION_NAME]
+        with collection.watch(
+            [{'$match': {'documentKey._id': CatalogVersion.DOCUMENT_ID}}],
+            full_document='updateLookup',
+            max_await_time_ms=int(self.poll_interval * 1000)
+        ) as stream:
+            self.mode = 'change_stream'
+            # Catch up on writes made before the stream was opened
+            self.poll()
+            while not self._stop.is_set():
+                event = stream.try_next()
+                if event is None:
+                    continue
+                if event.get('fullDocument'):
+                    self.apply(event['fullDocument'])
+                else:
+                    # Deleted or replaced without a post-image; re-read it
+                    self.poll()
+
+    def _run(self):
+        try:
+            self._watch()
+        except PyMongoError:
+            # Change streams need a replica set; fall back to polling
+            pass
+        self.mode = 'polling'
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except PyMongoError:
+                # Entries can no longer be trusted while the database is unreachable
+                self.cache.clear()
+                self.version = None
+            self._stop.wait(self.poll_interval)
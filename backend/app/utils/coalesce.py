@@ -0,0 +1,86 @@
+"""
+Request Coalescing
+Single-flight helper that lets concurrent callers share one in-flight query
+"""
+import threading
+
+
+class CoalesceTimeout(TimeoutError):
+    """Raised when a waiter gives up on an in-flight call for its key"""
+
+
+class _Call:
+    """A single in-flight call and the result shared with its waiters"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key
+    The first caller for a key runs the function; callers arriving while it is
+    still running wait for and receive the same result (or exception)
+    """
+
+    def __init__(self, timeout=5.0):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._executed = 0
+        self._coalesced = 0
+        self._timeouts = 0
+        self._errors = 0
+
+    def do(self, key, fn, timeout=None):
+        """
+        Run fn() once for all concurrent callers sharing key
+        Waiters raise CoalesceTimeout if the leader takes longer than timeout
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+                leader = True
+
+        if leader:
+            try:
+                call.result = fn()
+            except Exception as e:
+                call.error = e
+                with self._lock:
+                    self._errors += 1
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+                call.done.set()
+        else:
+            wait_for = self.timeout if timeout is None else timeout
+            if not call.done.wait(wait_for):
+                with self._lock:
+                    self._timeouts += 1
+                raise CoalesceTimeout(f'Timed out waiting for in-flight call {key!r}')
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def stats(self):
+        """Return counters for executed, deduplicated, timed out and failed calls"""
+        with self._lock:
+            return {
+                'executed': self._executed,
+                'coalesced': self._coalesced,
+                'timeouts': self._timeouts,
+                'errors': self._errors,
+                'in_flight': len(self._calls)
+            }
@@ -3,9 +3,11 @@ Custom Decorators
 Utility decorators for route protection and validation
 """
 from functools import wraps
-from flask import jsonify
+from flask import jsonify, current_app
 from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
 
+from app.utils.profiling import phase
+
 
 def jwt_required_with_user(fn):
     """
@@ -23,6 +25,41 @@ def jwt_required_with_user(fn):
     return wrapper
 
 
+def timed_jwt_required(**jwt_kwargs):
+    """
+    Same as flask_jwt_extended's jwt_required(), but records token
+    verification as the 'jwt_decode' request phase
+    Usage: @timed_jwt_required() or @timed_jwt_required(refresh=True)
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with phase('jwt_decode'):
+                verify_jwt_in_request(**jwt_kwargs)
+            return current_app.ensure_sync(fn)(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def admin_required(fn):
+    """
+    Decorator that requires a JWT belonging to an email listed in ADMIN_EMAILS
+    Usage: @admin_required
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        from app import mongo
+        from app.models.user import User
+        
+        with phase('jwt_decode'):
+            verify_jwt_in_request()
+        user = User.find_by_id(mongo.db, get_jwt_identity())
+        if not user or user.email not in current_app.config['ADMIN_EMAILS']:
+            return jsonify({'error': 'Admin access required'}), 403
+        return fn(*args, **kwargs)
+    return wrapper
+
+
 def validate_json(*required_fields):
     """
     Decorator to validate required JSON fields in request
@@ -0,0 +1,201 @@
+"""
+Profiling Utilities
+Per-request phase timings, slow-request capture and an on-demand stack sampler
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime
+
+from flask import g, has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+from pymongo import monitoring
+
+
+def record_phase(name, seconds):
+    """Add a timing to the current request's phases (no-op outside a request)"""
+    if not has_request_context():
+        return
+    phases = g.setdefault('profile_phases', {})
+    entry = phases.setdefault(name, {'ms': 0.0, 'count': 0})
+    entry['ms'] += seconds * 1000
+    entry['count'] += 1
+
+
+@contextmanager
+def phase(name):
+    """Time the enclosed block as a named phase of the current request"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(name, time.perf_counter() - start)
+
+
+class MongoPhaseListener(monitoring.CommandListener):
+    """Records each MongoDB command issued by a request as a 'mongo.<command>' phase"""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        record_phase(f'mongo.{event.command_name}', event.duration_micros / 1e6)
+
+    def failed(self, event):
+        record_phase(f'mongo.{event.command_name}', event.duration_micros / 1e6)
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """JSON provider that records response serialization as a phase"""
+
+    def dumps(self, obj, **kwargs):
+        with phase('serialize'):
+            return super().dumps(obj, **kwargs)
+
+
+class SlowRequestLog:
+    """Bounded ring buffer of requests slower than a threshold"""
+
+    def __init__(self, threshold_ms=500, size=100):
+        self.threshold_ms = threshold_ms
+        self._entries = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, entry):
+        """Store an entry if it crossed the threshold"""
+        if entry['duration_ms'] < self.threshold_ms:
+            return False
+        with self._lock:
+            self._entries.append(entry)
+        return True
+
+    def entries(self):
+        """Return captured requests, most recent first"""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class StackSampler:
+    """
+    Statistical profiler that periodically snapshots every thread's stack
+    Produces collapsed stacks ("frame;frame;frame count") for flame graph tools
+    """
+
+    # Innermost frames of threads parked in a wait or idle primitive; only
+    # treated as idle when no application frame is on the stack, so request
+    # threads blocked on a coalesced read or a pool checkout still show up
+    IDLE_FRAMES = {
+        ('threading.py', 'wait'),
+        ('selectors.py', 'select'),
+        ('socketserver.py', 'serve_forever'),
+        ('queue.py', 'get')
+    }
+
+    # Background threads that never serve requests
+    BACKGROUND_THREAD_PREFIXES = ('catalog-watcher', 'pymongo_')
+
+    # Frames from files under this directory count as application code
+    APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
+    MIN_INTERVAL = 0.001
+    MAX_INTERVAL = 1.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _label(frame):
+        code = frame.f_code
+        return f'{os.path.basename(code.co_filename)}:{code.co_name}'
+
+    @classmethod
+    def _collapse(cls, frame):
+        stack = []
+        while frame is not None:
+            stack.append(cls._label(frame))
+            frame = frame.f_back
+        return ';'.join(reversed(stack))
+
+    @classmethod
+    def _is_idle(cls, frame, thread_name):
+        if thread_name.startswith(cls.BACKGROUND_THREAD_PREFIXES):
+            return True
+        code = frame.f_code
+        if (os.path.basename(code.co_filename), code.co_name) not in cls.IDLE_FRAMES:
+            return False
+        while frame is not None:
+            if frame.f_code.co_filename.startswith(cls.APP_DIR):
+                return False
+            frame = frame.f_back
+        return True
+
+    def sample(self, seconds, interval=0.01, include_idle=False):
+        """
+        Sample all other threads for the given duration
+        The interval is clamped to MIN_INTERVAL..MAX_INTERVAL seconds; idle
+        threads (parked outside application code) and background threads are
+        skipped unless include_idle is set
+        Returns collapsed stacks as text, or None if a sampling run is already active
+        """
+        interval = min(max(interval, self.MIN_INTERVAL), self.MAX_INTERVAL)
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            counts = Counter()
+            current = threading.get_ident()
+            deadline = time.monotonic() + seconds
+            while True:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for ident, frame in sys._current_frames().items():
+                    if ident == current:
+                        continue
+                    if not include_idle and self._is_idle(frame, names.get(ident, '')):
+                        continue
+                    counts[self._collapse(frame)] += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(interval, remaining))
+            return '\n'.join(f'{stack} {count}' for stack, count in counts.most_common())
+        finally:
+            self._lock.release()
+
+
+def init_profiling(app):
+    """Install phase timing, the slow-request recorder and the stack sampler on an app"""
+    app.json = TimedJSONProvider(app)
+    slow_requests = SlowRequestLog(
+        threshold_ms=app.config['SLOW_REQUEST_THRESHOLD_MS'],
+        size=app.config['SLOW_REQUEST_LOG_SIZE']
+    )
+    app.extensions['slow_requests'] = slow_requests
+    app.extensions['stack_sampler'] = StackSampler()
+
+    @app.before_request
+    def start_request_timer():
+        g.profile_start = time.perf_counter()
+
+    @app.after_request
+    def record_slow_request(response):
+        start = g.get('profile_start')
+        if start is not None:
+            slow_requests.record({
+                'method': request.method,
+                'path': request.path,
+                'endpoint': request.endpoint,
+                'status': response.status_code,
+                'duration_ms': round((time.perf_counter() - start) * 1000, 3),
+                'phases': {
+                    name: {'ms': round(entry['ms'], 3), 'count': entry['count']}
+                    for name, entry in g.get('profile_phases', {}).items()
+                },
+                'at': datetime.utcnow().isoformat()
+            })
+        return response
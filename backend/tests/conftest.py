@@ -0,0 +1,48 @@
+"""
+Shared test fixtures
+"""
+import mongomock
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app import create_app, mongo
+from app.config import Config
+from app.models.video import catalog_cache
+
+
+class TestConfig(Config):
+    """Configuration for route tests (no background watcher)"""
+    TESTING = True
+    CATALOG_WATCH_ENABLED = False
+    JWT_SECRET_KEY = 'test-secret-key-that-is-at-least-32-bytes'
+
+
+@pytest.fixture
+def app(monkeypatch):
+    app = create_app(TestConfig)
+    monkeypatch.setattr(mongo, 'db', mongomock.MongoClient().video_app)
+    catalog_cache.clear()
+    yield app
+    catalog_cache.clear()
+
+
+@pytest.fixture
+def db(app):
+    return mongo.db
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def user_id():
+    return '64b000000000000000000001'
+
+
+@pytest.fixture
+def auth_headers(app, user_id):
+    with app.app_context():
+        token = create_access_token(identity=user_id)
+    return {'Authorization': f'Bearer {token}'}
@@ -0,0 +1,60 @@
+"""
+Auth Route Tests
+"""
+import pytest
+
+from app.models.user import User
+
+EMAIL = 'viewer@example.com'
+PASSWORD = 'testpass123'
+
+
+@pytest.fixture
+def tokens(client, db):
+    User.create(db, EMAIL, PASSWORD)
+    response = client.post('/auth/login', json={'email': EMAIL, 'password': PASSWORD})
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def bearer(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+def test_refresh_rotates_tokens(client, tokens):
+    response = client.post('/auth/refresh', headers=bearer(tokens['refresh_token']))
+
+    assert response.status_code == 200
+    renewed = response.get_json()
+    assert renewed['refresh_token'] != tokens['refresh_token']
+    assert client.get('/auth/me', headers=bearer(renewed['access_token'])).status_code == 200
+
+
+def test_reusing_a_refresh_token_revokes_its_family(client, tokens):
+    renewed = client.post('/auth/refresh', headers=bearer(tokens['refresh_token'])).get_json()
+
+    replay = client.post('/auth/refresh', headers=bearer(tokens['refresh_token']))
+    assert replay.status_code == 401
+
+    latest = client.post('/auth/refresh', headers=bearer(renewed['refresh_token']))
+    assert latest.status_code == 401
+
+
+def test_logout_blocks_the_access_token_and_refresh_family(client, tokens):
+    headers = bearer(tokens['access_token'])
+    assert client.post('/auth/logout', headers=headers).status_code == 200
+
+    blocked = client.get('/auth/me', headers=headers)
+    assert blocked.status_code == 401
+    # The mobile client only refreshes on flask-jwt-extended's {msg} errors
+    assert 'msg' in blocked.get_json()
+    refresh = client.post('/auth/refresh', headers=bearer(tokens['refresh_token']))
+    assert refresh.status_code == 401
+
+
+def test_wrong_password_uses_the_api_error_body(client, tokens):
+    response = client.post('/auth/login', json={'email': EMAIL, 'password': 'wrong'})
+
+    assert response.status_code == 401
+    assert 'error' in response.get_json()
+    assert 'msg' not in response.get_json()
@@ -0,0 +1,176 @@
+"""
+Catalog Cache and Watcher Tests
+"""
+import time
+
+import mongomock
+
+from app import create_app
+from app.config import Config
+from app.models.catalog import CatalogVersion
+from app.models.video import catalog_cache
+from app.utils.catalog_cache import CatalogCache, CatalogWatcher, MISSING
+
+
+def video_key(video_id):
+    return ('find_by_id', 'video_app', video_id)
+
+
+def active_key(limit=2):
+    return ('find_active', 'video_app', limit)
+
+
+def test_load_racing_an_invalidation_is_not_stored():
+    cache = CatalogCache()
+
+    def loader():
+        # Another worker's write lands while this query is in flight
+        cache.invalidate_video('a')
+        return {'title': 'stale'}
+
+    assert cache.get_or_load(video_key('a'), loader) == {'title': 'stale'}
+    assert cache.get(video_key('a')) is MISSING
+
+
+def test_get_many_racing_an_invalidation_is_not_stored():
+    cache = CatalogCache()
+
+    def loader(missing):
+        cache.clear()
+        return {key: {'title': 'stale'} for key in missing}
+
+    cache.get_many_or_load([video_key('a'), video_key('b')], loader)
+    assert cache.stats()['entries'] == 0
+
+
+def test_invalidate_video_drops_only_that_video_and_list_queries():
+    cache = CatalogCache()
+    cache.get_or_load(video_key('a'), lambda: {'title': 'A'})
+    cache.get_or_load(video_key('b'), lambda: {'title': 'B'})
+    cache.get_or_load(active_key(), lambda: [{'title': 'A'}])
+
+    cache.invalidate_video('a')
+
+    assert cache.get(video_key('a')) is MISSING
+    assert cache.get(active_key()) is MISSING
+    assert cache.get(video_key('b')) == {'title': 'B'}
+
+
+def test_misses_use_the_short_miss_ttl():
+    cache = CatalogCache(ttl=300, miss_ttl=0.05)
+    cache.get_or_load(video_key('unknown'), lambda: None)
+    cache.get_or_load(video_key('a'), lambda: {'title': 'A'})
+
+    time.sleep(0.1)
+
+    assert cache.stats()['entries'] == 1
+    assert cache.get(video_key('a')) == {'title': 'A'}
+
+
+def test_misses_are_not_cached_when_miss_ttl_is_zero():
+    cache = CatalogCache(miss_ttl=0)
+    cache.get_or_load(video_key('unknown'), lambda: None)
+    assert cache.stats()['entries'] == 0
+
+
+def test_size_is_bounded_by_evicting_least_recently_used():
+    cache = CatalogCache(max_entries=2)
+    cache.get_or_load(video_key('a'), lambda: 'A')
+    cache.get_or_load(video_key('b'), lambda: 'B')
+    cache.get(video_key('a'))
+    cache.get_or_load(video_key('c'), lambda: 'C')
+
+    assert cache.get(video_key('b')) is MISSING
+    assert cache.get(video_key('a')) == 'A'
+    assert cache.get(video_key('c')) == 'C'
+    assert cache.stats()['evictions'] == 1
+
+
+def test_expired_entries_are_swept():
+    cache = CatalogCache(ttl=0.01)
+    cache.get_many_or_load(
+        [video_key(i) for i in range(50)],
+        lambda missing: {key: 'video' for key in missing}
+    )
+    time.sleep(0.05)
+    assert cache.stats()['entries'] == 0
+
+
+def make_watcher(version):
+    cache = CatalogCache()
+    cache.get_or_load(video_key('a'), lambda: 'A')
+    cache.get_or_load(video_key('b'), lambda: 'B')
+    watcher = CatalogWatcher(mongomock.MongoClient().db, cache)
+    watcher.version = version
+    return watcher, cache
+
+
+def test_watcher_invalidates_selectively_when_changes_are_contiguous():
+    watcher, cache = make_watcher(3)
+
+    watcher.apply({'version': 4, 'changes': [
+        {'version': 3, 'video_id': 'b'},
+        {'version': 4, 'video_id': 'a'}
+    ]})
+
+    assert watcher.version == 4
+    assert cache.get(video_key('a')) is MISSING
+    assert cache.get(video_key('b')) == 'B'
+
+
+def test_watcher_clears_everything_when_changes_were_missed():
+    watcher, cache = make_watcher(3)
+
+    watcher.apply({'version': 6, 'changes': [{'version': 6, 'video_id': 'a'}]})
+
+    assert watcher.version == 6
+    assert cache.stats()['entries'] == 0
+
+
+def test_watcher_clears_everything_when_version_goes_backwards():
+    watcher, cache = make_watcher(5)
+
+    watcher.apply({'version': 1, 'changes': [{'version': 1, 'video_id': 'b'}]})
+
+    assert watcher.version == 1
+    assert cache.get(video_key('b')) is MISSING
+
+
+def test_watcher_clears_everything_when_version_document_disappears():
+    watcher, cache = make_watcher(5)
+
+    watcher.poll()
+
+    assert watcher.version == 0
+    assert cache.stats()['entries'] == 0
+
+
+def test_watcher_poll_follows_the_version_document():
+    watcher, cache = make_watcher(0)
+    watcher.mongo_db[CatalogVersion.COLLECTION_NAME].insert_one({
+        '_id': CatalogVersion.DOCUMENT_ID,
+        'version': 1,
+        'changes': [{'version': 1, 'video_id': 'a'}]
+    })
+
+    watcher.poll()
+
+    assert watcher.version == 1
+    assert cache.get(video_key('a')) is MISSING
+    assert cache.get(video_key('b')) == 'B'
+
+
+def test_unwatched_cache_falls_back_to_the_short_ttl():
+    class UnwatchedConfig(Config):
+        CATALOG_WATCH_ENABLED = False
+        CATALOG_CACHE_TTL = 300
+        CATALOG_CACHE_UNWATCHED_TTL = 5
+
+    class WatchedConfig(UnwatchedConfig):
+        CATALOG_WATCH_ENABLED = True
+
+    create_app(UnwatchedConfig)
+    assert catalog_cache.ttl == 5
+
+    create_app(WatchedConfig)
+    assert catalog_cache.ttl == 300
@@ -0,0 +1,81 @@
+"""
+SingleFlight Tests
+"""
+import threading
+import time
+
+import pytest
+
+from app.utils.coalesce import SingleFlight, CoalesceTimeout
+
+
+def run_concurrently(count, target):
+    """Start count threads running target and wait for all of them"""
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = []
+    results = []
+
+    def fn():
+        calls.append(1)
+        time.sleep(0.2)
+        return 'video'
+
+    run_concurrently(10, lambda: results.append(flight.do('key', fn)))
+
+    assert len(calls) == 1
+    assert results == ['video'] * 10
+    stats = flight.stats()
+    assert stats['executed'] == 1
+    assert stats['coalesced'] == 9
+    assert stats['in_flight'] == 0
+
+
+def test_error_is_raised_in_every_waiter():
+    flight = SingleFlight()
+    errors = []
+
+    def fn():
+        time.sleep(0.2)
+        raise ValueError('database down')
+
+    def call():
+        try:
+            flight.do('key', fn)
+        except ValueError as e:
+            errors.append(e)
+
+    run_concurrently(5, call)
+
+    assert len(errors) == 5
+    assert flight.stats()['errors'] == 1
+
+
+def test_waiter_times_out_while_leader_keeps_running():
+    flight = SingleFlight(timeout=0.05)
+    release = threading.Event()
+    leader = threading.Thread(target=lambda: flight.do('key', release.wait))
+    leader.start()
+    time.sleep(0.05)
+
+    with pytest.raises(CoalesceTimeout):
+        flight.do('key', lambda: 'unused')
+
+    release.set()
+    leader.join()
+    assert flight.stats()['timeouts'] == 1
+
+
+def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight()
+
+    assert flight.do('key', lambda: 1) == 1
+    assert flight.do('key', lambda: 2) == 2
+    assert flight.stats()['coalesced'] == 0
@@ -0,0 +1,85 @@
+"""
+Stack Sampler Tests
+"""
+import threading
+import time
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app.models.user import User
+from app.utils.coalesce import SingleFlight
+from app.utils.profiling import StackSampler
+
+
+def test_sampling_stops_at_the_deadline_for_long_intervals():
+    start = time.monotonic()
+    StackSampler().sample(0.1, interval=3600)
+    assert time.monotonic() - start < 0.5
+
+
+def test_idle_threads_are_skipped_unless_requested():
+    event = threading.Event()
+    thread = threading.Thread(target=event.wait, name='idle-waiter')
+    thread.start()
+    try:
+        assert 'threading.py:wait' not in StackSampler().sample(0.05)
+        assert 'threading.py:wait' in StackSampler().sample(0.05, include_idle=True)
+    finally:
+        event.set()
+        thread.join()
+
+
+def test_threads_waiting_in_application_code_are_sampled():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def leader_query():
+        release.wait()
+
+    leader = threading.Thread(target=lambda: flight.do('video', leader_query))
+    leader.start()
+    time.sleep(0.05)
+    waiter = threading.Thread(target=lambda: flight.do('video', leader_query))
+    waiter.start()
+    time.sleep(0.05)
+    try:
+        stacks = StackSampler().sample(0.05)
+    finally:
+        release.set()
+        leader.join()
+        waiter.join()
+
+    assert 'coalesce.py:do;test_profiling.py:leader_query;threading.py:wait' in stacks
+    assert 'coalesce.py:do;threading.py:wait' in stacks
+
+
+@pytest.fixture
+def admin_headers(app, db):
+    app.config['ADMIN_EMAILS'] = ['admin@example.com']
+    admin = User.create(db, 'admin@example.com', 'adminpass123')
+    with app.app_context():
+        token = create_access_token(identity=str(admin._id))
+    return {'Authorization': f'Bearer {token}'}
+
+
+def test_profile_requires_a_boolean_include_idle(client, admin_headers):
+    response = client.post(
+        '/admin/profile',
+        json={'seconds': 0.01, 'include_idle': 'false'},
+        headers=admin_headers
+    )
+    assert response.status_code == 400
+
+    response = client.post(
+        '/admin/profile',
+        json={'seconds': 0.01, 'include_idle': True},
+        headers=admin_headers
+    )
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+
+
+def test_profile_rejects_non_admin_users(client, auth_headers):
+    response = client.post('/admin/profile', json={'seconds': 0.01}, headers=auth_headers)
+    assert response.status_code == 403
@@ -0,0 +1,60 @@
+"""
+Refresh Token Family Tests
+"""
+from datetime import timedelta
+
+import mongomock
+
+from app.models.refresh_token import RefreshTokenFamily
+
+EXPIRES_IN = timedelta(days=30)
+
+
+def make_family():
+    mongo_db = mongomock.MongoClient().db
+    family_id, nonce = RefreshTokenFamily.create(mongo_db, 'user-1', EXPIRES_IN)
+    return mongo_db, family_id, nonce
+
+
+def get_family(mongo_db, family_id):
+    return mongo_db[RefreshTokenFamily.COLLECTION_NAME].find_one({'_id': family_id})
+
+
+def test_rotate_replaces_the_current_nonce():
+    mongo_db, family_id, nonce = make_family()
+
+    new_nonce = RefreshTokenFamily.rotate(mongo_db, family_id, 'user-1', nonce, EXPIRES_IN)
+
+    assert new_nonce and new_nonce != nonce
+    assert get_family(mongo_db, family_id)['nonce'] == new_nonce
+    assert RefreshTokenFamily.rotate(
+        mongo_db, family_id, 'user-1', new_nonce, EXPIRES_IN
+    )
+
+
+def test_replaying_a_rotated_token_revokes_the_family():
+    mongo_db, family_id, nonce = make_family()
+    new_nonce = RefreshTokenFamily.rotate(mongo_db, family_id, 'user-1', nonce, EXPIRES_IN)
+
+    assert RefreshTokenFamily.rotate(mongo_db, family_id, 'user-1', nonce, EXPIRES_IN) is None
+
+    assert get_family(mongo_db, family_id)['revoked'] is True
+    # The legitimate holder's latest token is now rejected too
+    assert RefreshTokenFamily.rotate(
+        mongo_db, family_id, 'user-1', new_nonce, EXPIRES_IN
+    ) is None
+
+
+def test_rotate_rejects_a_token_for_another_user():
+    mongo_db, family_id, nonce = make_family()
+
+    assert RefreshTokenFamily.rotate(mongo_db, family_id, 'user-2', nonce, EXPIRES_IN) is None
+    assert get_family(mongo_db, family_id)['revoked'] is True
+
+
+def test_revoked_family_cannot_rotate():
+    mongo_db, family_id, nonce = make_family()
+
+    assert RefreshTokenFamily.revoke(mongo_db, family_id)
+    assert not RefreshTokenFamily.revoke(mongo_db, family_id)
+    assert RefreshTokenFamily.rotate(mongo_db, family_id, 'user-1', nonce, EXPIRES_IN) is None
@@ -0,0 +1,128 @@
+"""
+Video Route Tests
+"""
+from unittest import mock
+
+import pytest
+from mongomock.collection import Collection
+
+from app.models.video import Video
+from app.routes.video import MAX_BATCH_ITEMS
+from app.utils.coalesce import CoalesceTimeout
+
+
+def test_embed_page_reports_coalesce_timeout_as_html(client):
+    with mock.patch.object(Video, 'find_by_id', side_effect=CoalesceTimeout('busy')):
+        response = client.get('/video/64b000000000000000000009/embed?token=t&user_id=u')
+
+    assert response.status_code == 503
+    assert response.mimetype == 'text/html'
+
+
+def test_stream_reports_coalesce_timeout_as_json(client, auth_headers):
+    with mock.patch.object(Video, 'find_by_id', side_effect=CoalesceTimeout('busy')):
+        response = client.get(
+            '/video/64b000000000000000000009/stream?token=t', headers=auth_headers
+        )
+
+    assert response.status_code == 503
+    assert 'error' in response.get_json()
+
+
+def add_video(db, title, is_active=True):
+    video = Video(
+        title=title,
+        description=f'{title} description',
+        youtube_id=f'yt-{title}',
+        thumbnail_url=f'https://img.example.com/{title}.jpg',
+        is_active=is_active
+    )
+    video._id = db.videos.insert_one(video.to_dict()).inserted_id
+    return video
+
+
+def batch(client, headers, items):
+    return client.post('/video/stream/batch', json={'items': items}, headers=headers)
+
+
+@pytest.fixture
+def videos(db):
+    return {
+        'first': add_video(db, 'first'),
+        'second': add_video(db, 'second'),
+        'inactive': add_video(db, 'inactive', is_active=False)
+    }
+
+
+def item(video, user_id, token=None):
+    return {
+        'video_id': str(video._id),
+        'token': token or video.generate_playback_token(user_id)
+    }
+
+
+def test_batch_returns_results_in_request_order(client, auth_headers, user_id, videos):
+    items = [item(videos['second'], user_id), item(videos['first'], user_id)]
+
+    response = batch(client, auth_headers, items)
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [r['title'] for r in results] == ['second', 'first']
+    assert results[0]['embed_url'].startswith('https://www.youtube.com/embed/yt-second')
+
+
+def test_batch_resolves_duplicate_ids_with_one_lookup(
+        client, auth_headers, user_id, videos):
+    first = item(videos['first'], user_id)
+
+    with mock.patch.object(Collection, 'find', autospec=True, side_effect=Collection.find) as find:
+        response = batch(client, auth_headers, [first, first])
+
+    results = response.get_json()['results']
+    assert [r['title'] for r in results] == ['first', 'first']
+    assert find.call_count == 1
+    assert find.call_args.args[1] == {'_id': {'$in': [videos['first']._id]}}
+
+
+def test_batch_reports_per_item_errors(client, auth_headers, user_id, videos):
+    items = [
+        'not-an-object',
+        {'video_id': str(videos['first']._id)},
+        {'video_id': '64b0000000000000000000ff', 'token': 't'},
+        {'video_id': 'malformed', 'token': 't'},
+        item(videos['inactive'], user_id),
+        item(videos['first'], user_id, token='bad-token'),
+        item(videos['second'], user_id)
+    ]
+
+    response = batch(client, auth_headers, items)
+
+    assert response.status_code == 200
+    statuses = [r.get('status', 200) for r in response.get_json()['results']]
+    assert statuses == [400, 400, 404, 404, 403, 401, 200]
+
+
+def test_batch_rejects_too_many_items(client, auth_headers):
+    items = [{'video_id': '64b000000000000000000009', 'token': 't'}] * (MAX_BATCH_ITEMS + 1)
+
+    assert batch(client, auth_headers, items).status_code == 400
+
+
+def test_batch_rejects_missing_or_empty_items(client, auth_headers):
+    assert batch(client, auth_headers, []).status_code == 400
+    response = client.post('/video/stream/batch', json={}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_find_by_ids_queries_only_cache_misses(db, videos):
+    first, second = str(videos['first']._id), str(videos['second']._id)
+    Video.find_by_id(db, first)
+
+    with mock.patch.object(Collection, 'find', autospec=True, side_effect=Collection.find) as find:
+        found = Video.find_by_ids(db, [first, second, 'malformed'])
+        Video.find_by_ids(db, [first, second])
+
+    assert set(found) == {first, second}
+    assert find.call_count == 1
+    assert find.call_args.args[1] == {'_id': {'$in': [videos['second']._id]}}
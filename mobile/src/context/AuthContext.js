@@ -56,6 +56,7 @@ export const AuthProvider = ({ children }) => {
 
         // Store token and user data
         await TokenService.setToken(result.access_token);
+        await TokenService.setRefreshToken(result.refresh_token);
         await TokenService.setUser(result.user);
 
         setUser(result.user);
@@ -65,6 +66,12 @@ export const AuthProvider = ({ children }) => {
     };
 
     const logout = async () => {
+        try {
+            // Revoke refresh tokens on the backend
+            await AuthAPI.logout();
+        } catch (error) {
+            // Already expired - clearing local tokens is enough
+        }
         await TokenService.clearAll();
         setUser(null);
         setIsAuthenticated(false);
@@ -18,6 +18,7 @@ const api = axios.create({
 
 // Token storage keys
 const TOKEN_KEY = 'jwt_token';
+const REFRESH_TOKEN_KEY = 'jwt_refresh_token';
 const USER_KEY = 'user_data';
 
 /**
@@ -49,6 +50,31 @@ export const TokenService = {
         }
     },
 
+    async getRefreshToken() {
+        try {
+            return await SecureStore.getItemAsync(REFRESH_TOKEN_KEY);
+        } catch (error) {
+            console.error('Error getting refresh token:', error);
+            return null;
+        }
+    },
+
+    async setRefreshToken(token) {
+        try {
+            await SecureStore.setItemAsync(REFRESH_TOKEN_KEY, token);
+        } catch (error) {
+            console.error('Error setting refresh token:', error);
+        }
+    },
+
+    async removeRefreshToken() {
+        try {
+            await SecureStore.deleteItemAsync(REFRESH_TOKEN_KEY);
+        } catch (error) {
+            console.error('Error removing refresh token:', error);
+        }
+    },
+
     async getUser() {
         try {
             const userData = await SecureStore.getItemAsync(USER_KEY);
@@ -77,6 +103,7 @@ export const TokenService = {
 
     async clearAll() {
         await this.removeToken();
+        await this.removeRefreshToken();
         await this.removeUser();
     },
 };
@@ -93,13 +120,59 @@ api.interceptors.request.use(
     (error) => Promise.reject(error)
 );
 
-// Response interceptor - Handle errors
+// Single in-flight refresh shared by all requests that hit a 401
+let refreshPromise = null;
+
+const refreshTokens = async () => {
+    const refreshToken = await TokenService.getRefreshToken();
+    if (!refreshToken) {
+        throw new Error('No refresh token');
+    }
+    // Plain axios call so the interceptors below don't recurse
+    const response = await axios.post(`${API_CONFIG.BASE_URL}/auth/refresh`, null, {
+        timeout: API_CONFIG.TIMEOUT,
+        headers: { Authorization: `Bearer ${refreshToken}` },
+    });
+    await TokenService.setToken(response.data.access_token);
+    await TokenService.setRefreshToken(response.data.refresh_token);
+    return response.data.access_token;
+};
+
+// Auth endpoints whose 401s mean bad credentials, never an expired access token
+const NO_REFRESH_PATHS = ['/auth/login', '/auth/signup', '/auth/refresh'];
+
+// flask-jwt-extended reports JWT failures as { msg }; this API's own
+// 401s (bad password, bad playback token) use { error }
+const isJwtFailure = (error) => {
+    const data = error.response?.data;
+    return error.response?.status === 401 && Boolean(data?.msg) && !data?.error;
+};
+
+// Response interceptor - Renew expired access tokens, then retry once
 api.interceptors.response.use(
     (response) => response,
-    (error) => {
-        if (error.response?.status === 401) {
-            // Token expired - will be handled by auth context
-            console.log('Unauthorized - token may be expired');
+    async (error) => {
+        const original = error.config;
+        if (
+            original &&
+            !original._retried &&
+            !NO_REFRESH_PATHS.includes(original.url) &&
+            isJwtFailure(error)
+        ) {
+            original._retried = true;
+            try {
+                if (!refreshPromise) {
+                    refreshPromise = refreshTokens().finally(() => {
+                        refreshPromise = null;
+                    });
+                }
+                const accessToken = await refreshPromise;
+                original.headers.Authorization = `Bearer ${accessToken}`;
+                return api(original);
+            } catch (refreshError) {
+                // Refresh token expired or revoked - will be handled by auth context
+                console.log('Unauthorized - session expired');
+            }
         }
         return Promise.reject(error);
     }
@@ -123,6 +196,11 @@ export const AuthAPI = {
         const response = await api.get('/auth/me');
         return response.data;
     },
+
+    async logout() {
+        const response = await api.post('/auth/logout');
+        return response.data;
+    },
 };
 
 /**
@@ -141,6 +219,12 @@ export const VideoAPI = {
         return response.data;
     },
 
+    // Resolve several videos in one round trip: items = [{ video_id, token }]
+    async getStreamUrls(items) {
+        const response = await api.post('/video/stream/batch', { items });
+        return response.data;
+    },
+
     // Build embed URL for WebView (direct backend route)
     buildEmbedUrl(videoId, playbackToken, userId) {
         return `${API_CONFIG.BASE_URL}/video/${videoId}/embed?token=${encodeURIComponent(playbackToken)}&user_id=${userId}`;